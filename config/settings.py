@@ -15,6 +15,11 @@ DEBUG = os.getenv("DEBUG", "False") == "True"
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "*").split(",")
 DATABASE_URL = os.getenv("DATABASE_URL")
 OPENROUTESERVICE_API_KEY = os.getenv("OPENROUTESERVICE_API_KEY")
+# Worker threads for concurrent ORS calls (size to the server's request threads)
+ORS_MAX_WORKERS = int(os.getenv("ORS_MAX_WORKERS", "20"))
+# Rows per INSERT for import_fuel_prices (defaults depend on the DB backend);
+# kept as a string and validated by the command, not at startup
+FUEL_BULK_BATCH_SIZE = os.getenv("FUEL_BULK_BATCH_SIZE") or None
 
 # Application definition
 INSTALLED_APPS = [
@@ -115,6 +120,36 @@ else:
 
 
 
+# Cache configuration (Redis via REDIS_URL, in-memory fallback)
+# Redis needs the redis package installed (pip install redis)
+# Used to store geocoding and routing results from OpenRouteService
+# and the cheapest fuel station per state
+
+REDIS_URL = os.getenv("REDIS_URL")
+# How long geocoding results are kept, in seconds (default one day)
+GEOCODE_CACHE_TIMEOUT = int(os.getenv("GEOCODE_CACHE_TIMEOUT", "86400"))
+# How long routes between the same coordinates are kept, in seconds
+ROUTE_CACHE_TIMEOUT = int(os.getenv("ROUTE_CACHE_TIMEOUT", "86400"))
+# How long the cheapest station per state is kept, in seconds
+STATION_CACHE_TIMEOUT = int(os.getenv("STATION_CACHE_TIMEOUT", "3600"))
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': 4096},
+        }
+    }
+
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
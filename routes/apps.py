@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class RoutesConfig(AppConfig):
     name = 'routes'
+
+    def ready(self):
+        # Register signal handlers (cache invalidation for fuel stations)
+        from . import signals  # noqa: F401
@@ -1,6 +1,43 @@
+import argparse
 import csv
+import io
+from decimal import ROUND_HALF_UP, Decimal
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from routes.models import FuelStation
+from routes.services.stations import invalidate_cheapest_by_state
+
+# Number of FuelStation instances built in memory before flushing to the DB
+CHUNK_SIZE = 5000
+
+# Rows per INSERT statement when FUEL_BULK_BATCH_SIZE / --batch-size is not set
+DEFAULT_BATCH_SIZE = 2000
+POSTGRES_BATCH_SIZE = 5000
+
+# Prices are stored rounded to whole cents, half-up on every backend (this
+# matches PostgreSQL's numeric rounding; migration 0002 rounds rows left
+# unrounded by older SQLite imports the same way)
+CENT = Decimal('0.01')
+
+# Largest price the API serializes (2-decimal strings of at most 5 digits)
+MAX_PRICE = Decimal('999.99')
+
+# CSV columns that must be present in the header
+REQUIRED_COLUMNS = ('Truckstop Name', 'State', 'Retail Price')
+
+
+def positive_int(value):
+    """
+    argparse type for --batch-size (also applied to the FUEL_BULK_BATCH_SIZE default).
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid batch size: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"batch size must be at least 1, got {number}")
+    return number
 
 
 class Command(BaseCommand):
@@ -13,55 +50,46 @@ class Command(BaseCommand):
             default='fuel-prices.csv',
             help='Path to the fuel prices CSV file'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=positive_int,
+            default=settings.FUEL_BULK_BATCH_SIZE,
+            help=(
+                'Rows per INSERT statement (env: FUEL_BULK_BATCH_SIZE, '
+                f'default {DEFAULT_BATCH_SIZE}, {POSTGRES_BATCH_SIZE} on PostgreSQL)'
+            )
+        )
+        parser.add_argument(
+            '--no-copy',
+            action='store_true',
+            help='Use bulk_create INSERTs instead of COPY on PostgreSQL'
+        )
 
     def handle(self, *args, **options):
         file_path = options['file']
+        use_copy = connection.vendor == 'postgresql' and not options['no_copy']
+        batch_size = options['batch_size'] or (
+            POSTGRES_BATCH_SIZE if connection.vendor == 'postgresql' else DEFAULT_BATCH_SIZE
+        )
 
-        station_map = {}  # (station_name, state) -> FuelStation
-        skipped_count = 0
-        failed_count = 0
+        self.skipped_count = 0
+        self.failed_count = 0
 
         self.stdout.write(self.style.NOTICE(
             f"Starting fuel stations import from: {file_path}"
         ))
 
+        before_count = FuelStation.objects.count()
+
         try:
             with open(file_path, newline='', encoding='utf-8') as csv_file:
-                reader = csv.DictReader(csv_file)
-
-                for row_number, row in enumerate(reader, start=1):
-                    try:
-                        station_name = row.get('Truckstop Name', '').strip()
-                        state = row.get('State', '').strip()
-                        price = row.get('Retail Price', '').strip()
-
-                        if not station_name or not state or not price:
-                            skipped_count += 1
-                            continue
-
-                        price = float(price)
-                        key = (station_name, state)
-
-                        # If station already exists, keep the HIGHEST price
-                        if key in station_map:
-                            if price > station_map[key].price_per_gallon:
-                                station_map[key].price_per_gallon = price
-                        else:
-                            station_map[key] = FuelStation(
-                                station_name=station_name,
-                                state=state,
-                                address=row.get('Address', '').strip(),
-                                city=row.get('City', '').strip(),
-                                price_per_gallon=price,
-                            )
-
-                    except Exception as row_error:
-                        failed_count += 1
-                        self.stderr.write(
-                            self.style.ERROR(
-                                f"Row {row_number} failed: {row_error}"
-                            )
-                        )
+                rows = self._read_rows(csv.reader(csv_file))
+
+                if use_copy:
+                    # Duplicates are resolved by PostgreSQL during the insert
+                    self._copy_insert(rows)
+                else:
+                    self._bulk_insert(self._dedupe(rows), batch_size)
 
         except FileNotFoundError:
             self.stderr.write(
@@ -69,17 +97,142 @@ class Command(BaseCommand):
             )
             return
 
-        before_count = FuelStation.objects.count()
-
-        FuelStation.objects.bulk_create(
-            station_map.values(),
-            batch_size=500,
-            ignore_conflicts=True,
-        )
+        # bulk_create/COPY bypass model signals, so refresh the cached
+        # cheapest-station table explicitly
+        invalidate_cheapest_by_state()
 
         after_count = FuelStation.objects.count()
 
         self.stdout.write(self.style.SUCCESS("Fuel stations import completed"))
         self.stdout.write(f"Added records   : {after_count - before_count}") 
-        self.stdout.write(f"Skipped records : {skipped_count}")
-        self.stdout.write(f"Failed records  : {failed_count}")
+        self.stdout.write(f"Skipped records : {self.skipped_count}")
+        self.stdout.write(f"Failed records  : {self.failed_count}")
+
+    def _read_rows(self, reader):
+        # Yield (station_name, state, price, address, city) for every valid row.
+        # Plain csv.reader + column indexes avoids building a dict per row.
+        header = next(reader, [])
+        columns = {name.strip(): index for index, name in enumerate(header)}
+
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            self.stderr.write(
+                self.style.ERROR(f"Missing CSV column(s): {', '.join(missing)}")
+            )
+            return
+
+        name_i = columns['Truckstop Name']
+        state_i = columns['State']
+        price_i = columns['Retail Price']
+        address_i = columns.get('Address')
+        city_i = columns.get('City')
+
+        for row_number, row in enumerate(reader, start=1):
+            if not row:
+                continue  # blank line
+
+            try:
+                station_name = row[name_i].strip()
+                state = row[state_i].strip()
+                price = row[price_i].strip()
+
+                if not station_name or not state or not price:
+                    self.skipped_count += 1
+                    continue
+
+                price = Decimal(price).quantize(CENT, rounding=ROUND_HALF_UP)
+                if not -MAX_PRICE <= price <= MAX_PRICE:
+                    raise ValueError(f"price {price} is out of range")
+
+                yield (
+                    station_name,
+                    state,
+                    float(price),
+                    row[address_i].strip() if address_i is not None else '',
+                    row[city_i].strip() if city_i is not None else '',
+                )
+
+            except Exception as row_error:
+                self.failed_count += 1
+                self.stderr.write(
+                    self.style.ERROR(
+                        f"Row {row_number} failed: {row_error}"
+                    )
+                )
+
+    def _dedupe(self, rows):
+        station_map = {}  # (station_name, state) -> [price, address, city]
+
+        for station_name, state, price, address, city in rows:
+            key = (station_name, state)
+
+            # If station already exists, keep the HIGHEST price
+            if key in station_map:
+                if price > station_map[key][0]:
+                    station_map[key][0] = price
+            else:
+                station_map[key] = [price, address, city]
+
+        return station_map
+
+    def _bulk_insert(self, station_map, batch_size):
+        # Build model instances chunk by chunk so only CHUNK_SIZE of them
+        # are alive at once, committing everything in a single transaction
+        buffer = []
+        with transaction.atomic():
+            for (station_name, state), (price, address, city) in station_map.items():
+                buffer.append(FuelStation(
+                    station_name=station_name,
+                    state=state,
+                    address=address,
+                    city=city,
+                    price_per_gallon=price,
+                ))
+                if len(buffer) >= CHUNK_SIZE:
+                    self._flush(buffer, batch_size)
+            self._flush(buffer, batch_size)
+
+    def _flush(self, buffer, batch_size):
+        FuelStation.objects.bulk_create(
+            buffer,
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        buffer.clear()
+
+    def _copy_insert(self, rows):
+        # PostgreSQL only: stream all raw rows with a single COPY into a temp
+        # table, then move them over in one INSERT ... SELECT that keeps the
+        # highest price per (station_name, state) with the address/city of
+        # its first row, exactly like _dedupe. ON CONFLICT DO NOTHING gives
+        # the same semantics as bulk_create(ignore_conflicts=True).
+        data = io.StringIO()
+        writer = csv.writer(data)
+        for row_number, (station_name, state, price, address, city) in enumerate(rows):
+            writer.writerow([row_number, station_name, address, city, state, price])
+        data.seek(0)
+
+        table = connection.ops.quote_name(FuelStation._meta.db_table)
+        columns = "station_name, address, city, state, price_per_gallon"
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE fuel_station_import ON COMMIT DROP AS "
+                f"SELECT 0 AS row_number, {columns} FROM {table} WITH NO DATA"
+            )
+            # csv.writer emits '' unquoted, which COPY would read as NULL;
+            # FORCE_NOT_NULL keeps empty address/city as '' (NOT NULL columns)
+            cursor.copy_expert(
+                f"COPY fuel_station_import (row_number, {columns}) FROM STDIN "
+                f"WITH (FORMAT csv, FORCE_NOT_NULL (address, city))",
+                data,
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}, created_at) "
+                f"SELECT DISTINCT ON (station_name, state) "
+                f"station_name, address, city, state, "
+                f"MAX(price_per_gallon) OVER (PARTITION BY station_name, state), now() "
+                f"FROM fuel_station_import "
+                f"ORDER BY station_name, state, row_number "
+                f"ON CONFLICT (station_name, state) DO NOTHING"
+            )
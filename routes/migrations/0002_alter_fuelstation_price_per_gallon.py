@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:49
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+
+CENT = Decimal('0.01')
+
+
+def round_prices_to_cents(apps, schema_editor):
+    # The DecimalField only quantized prices when reading, so on SQLite rows
+    # still hold the raw CSV value (e.g. 2.999). Round them half-up to cents,
+    # the same way import_fuel_prices does.
+    FuelStation = apps.get_model('routes', 'FuelStation')
+    changed = []
+    for station in FuelStation.objects.only('id', 'price_per_gallon').iterator():
+        rounded = float(Decimal(str(station.price_per_gallon)).quantize(CENT, rounding=ROUND_HALF_UP))
+        if rounded != station.price_per_gallon:
+            station.price_per_gallon = rounded
+            changed.append(station)
+
+    FuelStation.objects.bulk_update(changed, ['price_per_gallon'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='fuelstation',
+            name='price_per_gallon',
+            field=models.FloatField(),
+        ),
+        migrations.RunPython(round_prices_to_cents, migrations.RunPython.noop),
+    ]
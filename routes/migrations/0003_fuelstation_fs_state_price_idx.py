@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0002_alter_fuelstation_price_per_gallon'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fuelstation',
+            index=models.Index(fields=['state', 'price_per_gallon'], name='fs_state_price_idx'),
+        ),
+    ]
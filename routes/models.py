@@ -6,13 +6,20 @@ class FuelStation(models.Model):
     address = models.CharField(max_length=255, blank=True)
     city = models.CharField(max_length=100, blank=True)
     state = models.CharField(max_length=10, db_index=True)
-    price_per_gallon = models.DecimalField(max_digits=5, decimal_places=2)
+    # Stored as float (rounded to cents on import) so cost math doesn't
+    # have to materialize and convert a Decimal for every row
+    price_per_gallon = models.FloatField()
 
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ('station_name', 'state')
         ordering = ['state', 'price_per_gallon']
+        indexes = [
+            # Matches the default ordering: "cheapest station in state X"
+            # becomes an index range scan instead of a sort
+            models.Index(fields=['state', 'price_per_gallon'], name='fs_state_price_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.station_name} ({self.state}) - ${self.price_per_gallon}"
+        return f"{self.station_name} ({self.state}) - ${self.price_per_gallon:.2f}"
@@ -3,6 +3,9 @@ from .models import FuelStation
 
 
 class FuelStationSerializer(serializers.ModelSerializer):
+    # Keep the API format of a 2-decimal string (e.g. "3.00")
+    price_per_gallon = serializers.DecimalField(max_digits=5, decimal_places=2)
+
     class Meta:
         model = FuelStation
         fields = [
@@ -21,3 +24,7 @@ class RoutePlanSerializer(serializers.Serializer):
     end = serializers.CharField(
         help_text="End location (must be inside the USA)",
     )
+    include_geometry = serializers.BooleanField(
+        default=True,
+        help_text="Return the route GeoJSON in map_data (false for cost-only requests)",
+    )
@@ -16,12 +16,67 @@ Key Optimizations:
 - BFS algorithm for state-to-state path finding
 """
 
+import hashlib
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, compress
+
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
 
 # OpenRouteService API base URL
 ORS_BASE_URL = "https://api.openrouteservice.org"
 
+# Shared HTTP session for all ORS calls: keeps TCP+TLS connections alive
+# between geocoding and routing requests instead of reconnecting every time.
+# Transient gateway errors are retried once or twice on the same pool; the
+# final response is still returned so raise_for_status() reports it.
+# Read timeouts are never retried (a hung call already used its timeout)
+# and a failed connect is retried at most once. A Retry-After header on a
+# 503 is ignored so the short backoff bounds the wait.
+_ORS_RETRY = Retry(
+    total=2,
+    connect=1,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+_ORS_SESSION = requests.Session()
+_ORS_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max(20, settings.ORS_MAX_WORKERS),
+        max_retries=_ORS_RETRY,
+    ),
+)
+_ORS_SESSION.headers["Authorization"] = settings.OPENROUTESERVICE_API_KEY
+
+# Worker threads for running independent ORS calls concurrently
+# (requests releases the GIL while waiting on the network). Shared by all
+# requests of the process, so it is sized like the server's thread count
+# (ORS_MAX_WORKERS) to keep concurrent lookups from queueing behind each other.
+_ORS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.ORS_MAX_WORKERS,
+    thread_name_prefix="ors",
+)
+
+# How long geocoding results stay in the Django cache (seconds)
+GEOCODE_CACHE_TIMEOUT = settings.GEOCODE_CACHE_TIMEOUT
+
+# How long routes between two coordinates stay in the Django cache (seconds)
+ROUTE_CACHE_TIMEOUT = settings.ROUTE_CACHE_TIMEOUT
+
 # USA bounding boxes for location validation
 # Format: (min_lon, min_lat, max_lon, max_lat)
 US_BBOXES = [
@@ -88,60 +143,63 @@ US_STATE_ABBREV = {
 # Reverse mapping: 2-letter code → full state name
 US_STATE_FULL_NAME = {abbr: name for name, abbr in US_STATE_ABBREV.items()}
 
-# State adjacency graph for BFS pathfinding
+# Codes and upper-case names → 2-letter code, so clean input needs one lookup
+_STATE_NORMALIZE = {**{abbr: abbr for abbr in US_STATE_ABBREV.values()}, **US_STATE_ABBREV}
+
+# State adjacency graph for BFS pathfinding (immutable tuples)
 # Used by build_state_corridor() to find shortest state-to-state path
 US_STATE_NEIGHBORS = {
-    "AL": ["FL", "GA", "TN", "MS"],
-    "AK": [],
-    "AZ": ["CA", "NV", "UT", "NM", "CO"],
-    "AR": ["TX", "OK", "MO", "TN", "MS", "LA"],
-    "CA": ["OR", "NV", "AZ"],
-    "CO": ["WY", "NE", "KS", "OK", "NM", "AZ", "UT"],
-    "CT": ["NY", "MA", "RI"],
-    "DE": ["MD", "PA", "NJ"],
-    "FL": ["AL", "GA"],
-    "GA": ["FL", "AL", "TN", "NC", "SC"],
-    "HI": [],
-    "ID": ["WA", "OR", "NV", "UT", "WY", "MT"],
-    "IL": ["WI", "IA", "MO", "KY", "IN", "MI"],
-    "IN": ["MI", "OH", "KY", "IL"],
-    "IA": ["MN", "SD", "NE", "MO", "IL", "WI"],
-    "KS": ["NE", "CO", "OK", "MO"],
-    "KY": ["IL", "IN", "OH", "WV", "VA", "TN", "MO"],
-    "LA": ["TX", "AR", "MS"],
-    "ME": ["NH"],
-    "MD": ["VA", "WV", "PA", "DE", "DC"],
-    "MA": ["NY", "VT", "NH", "RI", "CT"],
-    "MI": ["WI", "IN", "OH"],
-    "MN": ["ND", "SD", "IA", "WI"],
-    "MS": ["LA", "AR", "TN", "AL"],
-    "MO": ["IA", "IL", "KY", "TN", "AR", "OK", "KS", "NE"],
-    "MT": ["ID", "WY", "SD", "ND"],
-    "NE": ["SD", "IA", "MO", "KS", "CO", "WY"],
-    "NV": ["OR", "ID", "UT", "AZ", "CA"],
-    "NH": ["VT", "ME", "MA"],
-    "NJ": ["NY", "PA", "DE"],
-    "NM": ["AZ", "UT", "CO", "OK", "TX"],
-    "NY": ["PA", "NJ", "CT", "MA", "VT"],
-    "NC": ["VA", "TN", "GA", "SC"],
-    "ND": ["MT", "SD", "MN"],
-    "OH": ["PA", "WV", "KY", "IN", "MI"],
-    "OK": ["KS", "CO", "NM", "TX", "AR", "MO"],
-    "OR": ["WA", "ID", "NV", "CA"],
-    "PA": ["NY", "NJ", "DE", "MD", "WV", "OH"],
-    "RI": ["MA", "CT"],
-    "SC": ["NC", "GA"],
-    "SD": ["ND", "MT", "WY", "NE", "IA", "MN"],
-    "TN": ["KY", "VA", "NC", "GA", "AL", "MS", "AR", "MO"],
-    "TX": ["NM", "OK", "AR", "LA"],
-    "UT": ["ID", "WY", "CO", "NM", "AZ", "NV"],
-    "VT": ["NY", "NH", "MA"],
-    "VA": ["MD", "DC", "WV", "KY", "TN", "NC"],
-    "WA": ["ID", "OR"],
-    "WV": ["OH", "PA", "MD", "VA", "KY"],
-    "WI": ["MN", "IA", "IL", "MI"],
-    "WY": ["MT", "SD", "NE", "CO", "UT", "ID"],
-    "DC": ["MD", "VA"],
+    "AL": ("FL", "GA", "TN", "MS"),
+    "AK": (),
+    "AZ": ("CA", "NV", "UT", "NM", "CO"),
+    "AR": ("TX", "OK", "MO", "TN", "MS", "LA"),
+    "CA": ("OR", "NV", "AZ"),
+    "CO": ("WY", "NE", "KS", "OK", "NM", "AZ", "UT"),
+    "CT": ("NY", "MA", "RI"),
+    "DE": ("MD", "PA", "NJ"),
+    "FL": ("AL", "GA"),
+    "GA": ("FL", "AL", "TN", "NC", "SC"),
+    "HI": (),
+    "ID": ("WA", "OR", "NV", "UT", "WY", "MT"),
+    "IL": ("WI", "IA", "MO", "KY", "IN", "MI"),
+    "IN": ("MI", "OH", "KY", "IL"),
+    "IA": ("MN", "SD", "NE", "MO", "IL", "WI"),
+    "KS": ("NE", "CO", "OK", "MO"),
+    "KY": ("IL", "IN", "OH", "WV", "VA", "TN", "MO"),
+    "LA": ("TX", "AR", "MS"),
+    "ME": ("NH",),
+    "MD": ("VA", "WV", "PA", "DE", "DC"),
+    "MA": ("NY", "VT", "NH", "RI", "CT"),
+    "MI": ("WI", "IN", "OH"),
+    "MN": ("ND", "SD", "IA", "WI"),
+    "MS": ("LA", "AR", "TN", "AL"),
+    "MO": ("IA", "IL", "KY", "TN", "AR", "OK", "KS", "NE"),
+    "MT": ("ID", "WY", "SD", "ND"),
+    "NE": ("SD", "IA", "MO", "KS", "CO", "WY"),
+    "NV": ("OR", "ID", "UT", "AZ", "CA"),
+    "NH": ("VT", "ME", "MA"),
+    "NJ": ("NY", "PA", "DE"),
+    "NM": ("AZ", "UT", "CO", "OK", "TX"),
+    "NY": ("PA", "NJ", "CT", "MA", "VT"),
+    "NC": ("VA", "TN", "GA", "SC"),
+    "ND": ("MT", "SD", "MN"),
+    "OH": ("PA", "WV", "KY", "IN", "MI"),
+    "OK": ("KS", "CO", "NM", "TX", "AR", "MO"),
+    "OR": ("WA", "ID", "NV", "CA"),
+    "PA": ("NY", "NJ", "DE", "MD", "WV", "OH"),
+    "RI": ("MA", "CT"),
+    "SC": ("NC", "GA"),
+    "SD": ("ND", "MT", "WY", "NE", "IA", "MN"),
+    "TN": ("KY", "VA", "NC", "GA", "AL", "MS", "AR", "MO"),
+    "TX": ("NM", "OK", "AR", "LA"),
+    "UT": ("ID", "WY", "CO", "NM", "AZ", "NV"),
+    "VT": ("NY", "NH", "MA"),
+    "VA": ("MD", "DC", "WV", "KY", "TN", "NC"),
+    "WA": ("ID", "OR"),
+    "WV": ("OH", "PA", "MD", "VA", "KY"),
+    "WI": ("MN", "IA", "IL", "MI"),
+    "WY": ("MT", "SD", "NE", "CO", "UT", "ID"),
+    "DC": ("MD", "VA"),
 }
 
 
@@ -155,11 +213,16 @@ def normalize_state_code(value: str | None) -> str | None:
     if not value:
         return None
 
+    # Already a clean code (the common case for ORS "region_a") or name
+    code = _STATE_NORMALIZE.get(value)
+    if code:
+        return code
+
     value = value.strip().upper()
     if len(value) == 2:
         return value
 
-    return US_STATE_ABBREV.get(value)
+    return _STATE_NORMALIZE.get(value)
 
 
 def state_code_to_full_name(state_code: str | None) -> str | None:
@@ -175,11 +238,62 @@ def state_code_to_full_name(state_code: str | None) -> str | None:
     return US_STATE_FULL_NAME.get(state_code.upper())
 
 
+def _bfs_parents(start_state: str) -> dict[str, str | None]:
+    """
+    Run BFS from start_state over US_STATE_NEIGHBORS.
+
+    Returns:
+        Parent pointers for every reachable state (start_state maps to None)
+    """
+    queue = deque([start_state])
+    parents = {start_state: None}
+
+    while queue:
+        current = queue.popleft()
+        for neighbor in US_STATE_NEIGHBORS.get(current, ()):
+            if neighbor not in parents:
+                parents[neighbor] = current
+                queue.append(neighbor)
+
+    return parents
+
+
+def _precompute_state_corridors() -> dict[tuple[str, str], tuple[str, ...]]:
+    """
+    Build the shortest state path for every reachable (start, end) pair.
+
+    The adjacency graph is static (51 states), so running one BFS per state
+    at import time is cheap and turns every corridor lookup into a dict get.
+    Paths are stored as immutable tuples so they can be shared safely.
+    """
+    corridors = {}
+    for start_state in US_STATE_NEIGHBORS:
+        parents = _bfs_parents(start_state)
+
+        # Reconstruct path from end to start using parent pointers
+        for end_state in parents:
+            path = []
+            node = end_state
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            path.reverse()
+            corridors[(start_state, end_state)] = tuple(path)
+
+    return corridors
+
+
+# All-pairs shortest state paths: (start_state, end_state) → (states...)
+_CORRIDOR_CACHE = _precompute_state_corridors()
+
+
 def build_state_corridor(start_state: str | None, end_state: str | None) -> list[str]:
     """
-    Build shortest path through US states using BFS (Breadth-First Search).
+    Build shortest path through US states.
     
-    Uses US_STATE_NEIGHBORS adjacency graph to find path.
+    Paths are precomputed with BFS (Breadth-First Search) over the
+    US_STATE_NEIGHBORS adjacency graph when the module is loaded,
+    so this is a single dictionary lookup per request.
     
     Algorithm:
         1. Start at start_state
@@ -198,31 +312,13 @@ def build_state_corridor(start_state: str | None, end_state: str | None) -> list
     if not start_state or not end_state:
         return [state for state in [start_state, end_state] if state]
 
-    # BFS algorithm
-    queue = [start_state]
-    parents = {start_state: None}
-
-    while queue:
-        current = queue.pop(0)
-        if current == end_state:
-            break
-        for neighbor in US_STATE_NEIGHBORS.get(current, []):
-            if neighbor not in parents:
-                parents[neighbor] = current
-                queue.append(neighbor)
-
     # No path found (shouldn't happen with complete US graph)
-    if end_state not in parents:
+    path = _CORRIDOR_CACHE.get((start_state, end_state))
+    if path is None:
         return [start_state, end_state]
 
-    # Reconstruct path from end to start using parent pointers
-    path = []
-    node = end_state
-    while node is not None:
-        path.append(node)
-        node = parents.get(node)
-
-    return list(reversed(path))
+    # Callers get their own list; the cached tuple stays untouched
+    return list(path)
 
 
 def is_inside_usa(coords: list) -> bool:
@@ -252,6 +348,9 @@ def geocode_place(place_name: str, enforce_us: bool = False) -> dict:
     """
     Convert text location to coordinates using OpenRouteService Geocoding API.
     
+    Results are cached (Django cache) by normalized place name, so repeated
+    lookups of common locations skip the network round-trip.
+    
     Examples:
         "New York, NY" → {"coords": [-74.006, 40.7128], "country_code": "US", "state": "NY"}
     
@@ -266,10 +365,68 @@ def geocode_place(place_name: str, enforce_us: bool = False) -> dict:
             "state": "NY"               # 2-letter state code
         }
     """
+    cache_key = _geocode_cache_key(place_name, enforce_us)
+    result = _cache_get(cache_key)
+    if result is None:
+        result = _geocode_place_uncached(place_name, enforce_us)
+        _cache_set(cache_key, result, GEOCODE_CACHE_TIMEOUT)
+
+    return result
+
+
+def geocode_pair(start_name: str, end_name: str, enforce_us: bool = False) -> tuple[dict, dict]:
+    """
+    Geocode start and end locations concurrently.
+    
+    The end location is resolved on a worker thread while the start is
+    resolved on the calling thread, so a request pays one geocoding
+    round-trip instead of two.
+    
+    Returns:
+        (start_data, end_data), each in the geocode_place format
+    """
+    end_future = _ORS_EXECUTOR.submit(geocode_place, end_name, enforce_us)
+    start_data = geocode_place(start_name, enforce_us)
+    return start_data, end_future.result()
+
+
+def _cache_get(key: str):
+    """
+    Read from the Django cache; a broken cache backend counts as a miss.
+    """
+    try:
+        return cache.get(key)
+    except Exception:
+        logger.warning("Cache read failed for %s", key, exc_info=True)
+        return None
+
+
+def _cache_set(key: str, value, timeout: int) -> None:
+    """
+    Write to the Django cache; failures are logged and otherwise ignored.
+    """
+    try:
+        cache.set(key, value, timeout)
+    except Exception:
+        logger.warning("Cache write failed for %s", key, exc_info=True)
+
+
+def _geocode_cache_key(place_name: str, enforce_us: bool) -> str:
+    """
+    Build a cache key that ignores case and extra whitespace.
+    
+    The name is hashed so keys stay short and safe for any cache backend.
+    """
+    normalized = " ".join(place_name.lower().split())
+    digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    return f"ors:geocode:{int(enforce_us)}:{digest}"
+
+
+def _geocode_place_uncached(place_name: str, enforce_us: bool) -> dict:
+    """
+    Call the OpenRouteService Geocoding API (see geocode_place).
+    """
     url = f"{ORS_BASE_URL}/geocode/search"
-    headers = {
-        "Authorization": settings.OPENROUTESERVICE_API_KEY
-    }
     params = {
         "text": place_name,
         "size": 1,
@@ -278,7 +435,7 @@ def geocode_place(place_name: str, enforce_us: bool = False) -> dict:
     if enforce_us:
         params["boundary.country"] = "US"
 
-    response = requests.get(url, headers=headers, params=params, timeout=3)
+    response = _ORS_SESSION.get(url, params=params, timeout=3)
     response.raise_for_status()
 
     data = response.json()
@@ -290,19 +447,22 @@ def geocode_place(place_name: str, enforce_us: bool = False) -> dict:
     feature = features[0]
     properties = feature.get("properties", {})
 
-    country_code = (properties.get("country_code") or "").upper()
-    country_name = (properties.get("country") or "").lower()
-    state_raw = (
-        properties.get("region_a")
-        or properties.get("region")
-        or properties.get("state")
-        or properties.get("state_code")
-    )
+    country_code = properties.get("country_code")
+    country_code = country_code.upper() if country_code else ""
+
+    # First non-empty state field, in order of preference
+    state_raw = None
+    for key in ("region_a", "region", "state", "state_code"):
+        state_raw = properties.get(key)
+        if state_raw:
+            break
     state_code = normalize_state_code(state_raw)
 
-    # Fallback normalization
-    if not country_code and "united states" in country_name:
-        country_code = "US"
+    # Fallback normalization (country name is only needed without a code)
+    if not country_code:
+        country_name = properties.get("country")
+        if country_name and "united states" in country_name.lower():
+            country_code = "US"
 
     return {
         "coords": feature["geometry"]["coordinates"],  # [lon, lat]
@@ -327,24 +487,56 @@ def get_route(start_coords: list, end_coords: list) -> dict:
                 "distance": 2797.18,      # Total distance in miles
                 "duration": 162036        # Travel time in seconds
             },
-            "geometry": {...}            # Route coordinates (encoded or GeoJSON)
+            "geometry": "m{hwF..."       # Route coordinates (encoded polyline or GeoJSON)
         }
+    
+    The default JSON format is requested, so the geometry comes back as an
+    encoded polyline (~3-4x smaller than GeoJSON); use decode_polyline()
+    to turn it into coordinates.
+    
+    Results are cached (Django cache) by start/end coordinates, so the
+    same trip is only routed once; the compact encoded geometry is what
+    gets stored.
+    """
+    cache_key = _route_cache_key(start_coords, end_coords)
+    result = _cache_get(cache_key)
+    if result is None:
+        result = _get_route_uncached(start_coords, end_coords)
+        _cache_set(cache_key, result, ROUTE_CACHE_TIMEOUT)
+
+    return result
+
+
+def _route_cache_key(start_coords: list, end_coords: list) -> str:
+    """
+    Build a cache key from coordinates rounded to 5 decimals (~1 m),
+    the same precision ORS uses for encoded polylines.
+    """
+    (start_lon, start_lat), (end_lon, end_lat) = start_coords, end_coords
+    return (
+        f"ors:route:{start_lon:.5f},{start_lat:.5f}:"
+        f"{end_lon:.5f},{end_lat:.5f}"
+    )
+
+
+def _get_route_uncached(start_coords: list, end_coords: list) -> dict:
+    """
+    Call the ORS Directions API (see get_route for the result format).
     """
     url = f"{ORS_BASE_URL}/v2/directions/driving-car"
-    headers = {
-        "Authorization": settings.OPENROUTESERVICE_API_KEY,
-        "Content-Type": "application/json",
-    }
     payload = {
         "coordinates": [
             start_coords,
             end_coords
         ],
         "units": "mi",
-        "format": "geojson"
+        # Only the summary and geometry are used: skip turn-by-turn
+        # instructions and let ORS simplify the geometry server-side
+        "instructions": False,
+        "geometry_simplify": True,
     }
 
-    response = requests.post(url, json=payload, headers=headers, timeout=8)
+    response = _ORS_SESSION.post(url, json=payload, timeout=8)
     response.raise_for_status()
 
     data = response.json()
@@ -366,9 +558,28 @@ def get_route(start_coords: list, end_coords: list) -> dict:
     raise ValueError(f"Unexpected route response: {data}")
 
 
-def _point_line_distance(point: list[float], start: list[float], end: list[float]) -> float:
+def get_routes_batch(pairs: list[tuple[list, list]]) -> list[dict]:
+    """
+    Get several driving routes concurrently.
+    
+    Each (start_coords, end_coords) pair goes through get_route (and its
+    cache) on the shared ORS worker pool, so N legs cost about one
+    round-trip per pool slot instead of N sequential ones.
+    
+    Must not be called from a task already running on _ORS_EXECUTOR: it
+    blocks waiting on the same pool and can deadlock once all workers wait.
+    
+    Returns:
+        List of get_route results, in the same order as pairs
+    """
+    starts = [start for start, _ in pairs]
+    ends = [end for _, end in pairs]
+    return list(_ORS_EXECUTOR.map(get_route, starts, ends))
+
+
+def _farthest_point(coords: list[list[float]], lo: int, hi: int) -> tuple[int, float]:
     """
-    Calculate perpendicular distance from point to line segment.
+    Find the point between coords[lo] and coords[hi] farthest from that segment.
     
     Visual explanation:
          point (px, py)
@@ -381,45 +592,56 @@ def _point_line_distance(point: list[float], start: list[float], end: list[float
     algorithm to decide if a point is
     "close enough" to the line connecting its neighbors.
     
+    The whole segment is scanned in one call: the direction vector and its
+    squared length are computed once, and points are compared by squared
+    distance so only the winner needs a square root.
+    
     Args:
-        point: [x, y] coordinate to measure from
-        start: [x, y] line segment start
-        end: [x, y] line segment end
+        coords: list of [x, y] coordinates
+        lo: index of the line segment start
+        hi: index of the line segment end
     
     Returns:
-        Euclidean distance from point to line segment
+        (index, distance) of the farthest point, or (0, 0.0) if none is off the line
     """
-    # If start and end are the same point, just measure direct distance
-    if start == end:
-        dx = point[0] - start[0]
-        dy = point[1] - start[1]
-        return (dx * dx + dy * dy) ** 0.5  
-
     # Extract coordinates for clarity
-    sx, sy = start
-    ex, ey = end
-    px, py = point
+    sx, sy = coords[lo]
+    ex, ey = coords[hi]
     
     # STEP 1: Calculate line segment direction vector
     dx = ex - sx  # horizontal component
     dy = ey - sy  # vertical component
-    
-    # EDGE CASE 2: Double-check for zero-length segment
-    if dx == 0 and dy == 0:
-        return ((px - sx) ** 2 + (py - sy) ** 2) ** 0.5
+    seg_len_sq = dx * dx + dy * dy
 
-    # STEP 2: Project point onto the infinite line (find closest point on line)
-    t = ((px - sx) * dx + (py - sy) * dy) / (dx * dx + dy * dy)
-    
-    # STEP 3: Clamp to [0, 1] to stay within the segment
-    t = max(0.0, min(1.0, t))  # If t < 0, use start. If t > 1, use end.
-    
-    # STEP 4: Calculate the projection point on the segment
-    proj_x = sx + t * dx 
-    proj_y = sy + t * dy
-    
-    # STEP 5: Return distance from original point to projection point
-    return ((px - proj_x) ** 2 + (py - proj_y) ** 2) ** 0.5
+    max_dist_sq = 0.0
+    index = 0
+    for i in range(lo + 1, hi):  # Skip first and last (they're the line endpoints)
+        px, py = coords[i]
+        rx = px - sx
+        ry = py - sy
+
+        # EDGE CASE: zero-length segment, just measure direct distance to start
+        if seg_len_sq:
+            # STEP 2: Project point onto the infinite line (find closest point on line)
+            t = (rx * dx + ry * dy) / seg_len_sq
+
+            # STEP 3: Clamp to [0, 1] to stay within the segment
+            if t > 1.0:
+                t = 1.0  # Past the end, use end
+            elif t < 0.0:
+                t = 0.0  # Before the start, use start
+
+            # STEP 4: Offset from the projection point on the segment
+            rx -= t * dx
+            ry -= t * dy
+
+        # STEP 5: Squared distance from original point to projection point
+        dist_sq = rx * rx + ry * ry
+        if dist_sq > max_dist_sq:
+            max_dist_sq = dist_sq
+            index = i  # Remember which point is farthest
+
+    return index, max_dist_sq ** 0.5
 
 # from here until the end of the file are geometry processing functions, not coded by me, but used in some ORS responses
 def simplify_linestring(coords: list[list[float]], tolerance: float) -> list[list[float]]:
@@ -428,7 +650,11 @@ def simplify_linestring(coords: list[list[float]], tolerance: float) -> list[lis
     how it works?:
     Imagine drawing a line from first to last point. Any point in between that's
     "close enough" to this line can be removed. If a point is far from the line,
-    we keep it and recursively simplify the segments on either side.
+    we keep it and simplify the segments on either side.
+    
+    The segments still to be checked are kept on an explicit stack of
+    (lo, hi) index pairs instead of recursing, so long ORS routes can't
+    hit Python's recursion limit and no intermediate lists are sliced.
     
     Visual example:
     Before:  ●--●--●--●--●--●--●     (7 points)
@@ -443,28 +669,31 @@ def simplify_linestring(coords: list[list[float]], tolerance: float) -> list[lis
     if not coords or len(coords) <= 2:
         return coords
 
-    # STEP 1: Draw imaginary line from first to last point
-    start = coords[0]
-    end = coords[-1]
-    
-    # STEP 2: Find the point FARTHEST from this line (the "peak")
-    max_dist = 0.0
-    index = 0
-    for i in range(1, len(coords) - 1):  # Skip first and last (they're the line endpoints)
-        dist = _point_line_distance(coords[i], start, end)
-        if dist > max_dist:
-            max_dist = dist
-            index = i  # Remember which point is farthest
+    # Segments are (lo, hi) index pairs into the original list (never sliced);
+    # kept points are flagged in a compact byte mask
+    n = len(coords)
+    keep = bytearray(n)
+    keep[0] = keep[-1] = 1
+    stack = [(0, n - 1)]
+
+    while stack:
+        lo, hi = stack.pop()
 
-    # STEP 3: Decide if the farthest point is "significant"
-    if max_dist > tolerance:
-        # Point is far enough - it's important! Keep it and recursively simplify both sides
-        left = simplify_linestring(coords[: index + 1], tolerance)   # Simplify left segment
-        right = simplify_linestring(coords[index:], tolerance)        # Simplify right segment
-        return left[:-1] + right  # Merge (remove duplicate middle point)
+        # STEP 1 + 2: Draw imaginary line from coords[lo] to coords[hi] and
+        # find the point FARTHEST from it (the "peak")
+        index, max_dist = _farthest_point(coords, lo, hi)
 
-    # STEP 4: All middle points are too close - just keep start and end
-    return [start, end]
+        # STEP 3: Decide if the farthest point is "significant"
+        if max_dist > tolerance:
+            # Point is far enough - it's important! Keep it and check both sides later
+            keep[index] = 1
+            stack.append((index, hi))  # Right segment
+            stack.append((lo, index))  # Left segment
+
+        # STEP 4: Otherwise all middle points are too close - only start and end survive
+
+    # Materialize the result once, filtering in C
+    return list(compress(coords, keep))
 
 # This is a wrapper to simplify GeoJSON LineString geometries using the above algorithm
 def simplify_geojson_linestring(geometry: dict | None, tolerance: float) -> dict | None:
@@ -482,7 +711,10 @@ def simplify_geojson_linestring(geometry: dict | None, tolerance: float) -> dict
     if geometry.get("type") != "LineString":
         return geometry
 
-    coords = geometry.get("coordinates", [])
+    coords = geometry.get("coordinates")
+    if not isinstance(coords, list) or len(coords) <= 2:
+        return geometry  # nothing to simplify
+
     simplified = simplify_linestring(coords, tolerance)
     return {
         "type": "LineString",
@@ -503,54 +735,57 @@ def decode_polyline(encoded: str, precision: int = 5) -> list[list[float]]:
         3. Accumulate deltas to get absolute coordinates
         4. Divide by 10^precision to get decimal degrees
 
+    All integers are read in one flat pass over the ASCII bytes (no ord()
+    per character, no index bookkeeping), then paired up as (lat, lng).
+
     Returns:
         List of [longitude, latitude] coordinates
+
+    Raises:
+        ValueError: If the string ends in the middle of a value or a point
+    """
+    # Popular trips come back with the same polyline, so decoded points are
+    # memoized; callers still get fresh lists they are free to modify
+    return [list(point) for point in _decode_polyline_points(encoded, precision)]
+
+
+@lru_cache(maxsize=16)
+def _decode_polyline_points(encoded: str, precision: int) -> tuple[tuple[float, float], ...]:
+    """
+    Decode a polyline into an immutable tuple of (longitude, latitude) points.
     """
     # SETUP: Factor for converting integers back to decimal degrees
     factor = 10 ** precision  # precision=5 → factor=100000
-    coords = []
-    index = 0
-    
-    # Accumulated coordinates (starts at 0,0 then we add deltas)
-    lat = 0
-    lng = 0
-
-    # Read pairs of (latitude, longitude) deltas until string ends
-    while index < len(encoded):
-        # STEP 1: Decode latitude delta
-        shift = 0
-        result = 0
-        while True:
-            # Read each character as a 5-bit chunk
-            b = ord(encoded[index]) - 63  # Convert ASCII to 0-63 range
-            index += 1
-            
-            # Add this chunk's bits to the result
-            result |= (b & 0x1F) << shift  # 0x1F = 31 (bitmask for lower 5 bits)
-            shift += 5
-            
-            # If bit 6 is 0, this is the last chunk for this number
-            if b < 0x20:  # 0x20 = 32 (bit 6 set)
-                break
-        
-        # Convert from zig-zag encoding (handles negative numbers)
-        # If LSB is 1, number is negative: invert all bits
-        # If LSB is 0, number is positive: shift right by 1
-        lat += ~(result >> 1) if (result & 1) else (result >> 1)
-
-        # STEP 2: Decode longitude delta (same process)
-        shift = 0
-        result = 0
-        while True:
-            b = ord(encoded[index]) - 63
-            index += 1
-            result |= (b & 0x1F) << shift
+
+    # STEP 1: Decode every variable-length integer (lat and lng deltas alternate)
+    deltas = []
+    shift = 0
+    result = 0
+    for b in encoded.encode("ascii"):
+        # Each byte is a 5-bit chunk offset by 63
+        b -= 63
+
+        # Add this chunk's bits to the result
+        result |= (b & 0x1F) << shift  # 0x1F = 31 (bitmask for lower 5 bits)
+
+        # If bit 6 is 0, this is the last chunk for this number
+        if b < 0x20:  # 0x20 = 32 (bit 6 set)
+            # Convert from zig-zag encoding (handles negative numbers)
+            # If LSB is 1, number is negative: invert all bits
+            # If LSB is 0, number is positive: shift right by 1
+            deltas.append(~(result >> 1) if (result & 1) else (result >> 1))
+            shift = 0
+            result = 0
+        else:
             shift += 5
-            if b < 0x20:
-                break
-        lng += ~(result >> 1) if (result & 1) else (result >> 1)
 
-        # STEP 3: Convert accumulated integers to decimal degrees and store
-        coords.append([lng / factor, lat / factor])
+    if shift or len(deltas) % 2:
+        raise ValueError("Invalid encoded polyline")
+
+    # STEP 2: Accumulate (lat, lng) deltas, starting at (0, 0)
+    lats = accumulate(deltas[0::2])
+    lngs = accumulate(deltas[1::2])
 
-    return coords
+    # STEP 3: Convert accumulated integers to decimal degrees, building
+    # the output in a single pass (no per-point append)
+    return tuple((lng / factor, lat / factor) for lat, lng in zip(lats, lngs))
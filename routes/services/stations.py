@@ -0,0 +1,86 @@
+"""
+Fuel Station Lookup Module
+
+The station table is loaded once from fuel-prices.csv and rarely changes,
+so the cheapest station of every state is computed in one query and kept
+in the Django cache instead of being re-derived on every route request.
+
+The cached value is invalidated when a FuelStation is saved or deleted
+(see routes/signals.py) and after import_fuel_prices runs. Invalidation
+only reaches other processes through a shared cache (Redis via REDIS_URL):
+with the default per-process LocMemCache it clears just the cache of the
+process it runs in, and other workers keep serving the old table for up to
+STATION_CACHE_TIMEOUT seconds.
+
+Cache errors never break a request: a failed read counts as a miss, and a
+failed write or delete is logged and skipped.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from routes.models import FuelStation
+
+logger = logging.getLogger(__name__)
+
+CHEAPEST_BY_STATE_CACHE_KEY = "fuel:cheapest_by_state"
+
+# Fields returned for each station (plain dicts, not model instances)
+STATION_FIELDS = ('state', 'station_name', 'address', 'city', 'price_per_gallon')
+
+
+def get_cheapest_by_state() -> dict[str, dict]:
+    """
+    Return {state: cheapest station} for every state, ordered by state code.
+
+    Example:
+        {"AL": {"state": "AL", "station_name": "...", "price_per_gallon": 2.89, ...}, ...}
+    """
+    try:
+        cheapest = cache.get(CHEAPEST_BY_STATE_CACHE_KEY)
+    except Exception:
+        logger.warning("Cache read failed for %s", CHEAPEST_BY_STATE_CACHE_KEY, exc_info=True)
+        cheapest = None
+
+    if cheapest is None:
+        cheapest = {}
+        stations = FuelStation.objects.values(*STATION_FIELDS).order_by('state', 'price_per_gallon')
+        if connection.features.can_distinct_on_fields:
+            # PostgreSQL: DISTINCT ON returns one row per state straight
+            # from the (state, price_per_gallon) index
+            stations = stations.distinct('state')
+
+        for station in stations:
+            # Rows come cheapest-first within each state: keep the first one
+            if station['state'] not in cheapest:
+                cheapest[station['state']] = station
+
+        try:
+            cache.set(CHEAPEST_BY_STATE_CACHE_KEY, cheapest, settings.STATION_CACHE_TIMEOUT)
+        except Exception:
+            logger.warning("Cache write failed for %s", CHEAPEST_BY_STATE_CACHE_KEY, exc_info=True)
+
+    return cheapest
+
+
+def get_cheapest_stations(states: list[str]) -> dict[str, dict]:
+    """
+    Return {state: cheapest station} for the given states, ordered by state code.
+
+    States without any station are left out.
+    """
+    cheapest = get_cheapest_by_state()
+    return {state: cheapest[state] for state in sorted(set(states)) if state in cheapest}
+
+
+def invalidate_cheapest_by_state() -> None:
+    """
+    Drop the cached per-state cheapest stations (rebuilt on next use).
+    """
+    try:
+        cache.delete(CHEAPEST_BY_STATE_CACHE_KEY)
+    except Exception:
+        logger.warning("Cache delete failed for %s", CHEAPEST_BY_STATE_CACHE_KEY, exc_info=True)
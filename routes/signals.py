@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import FuelStation
+from .services.stations import invalidate_cheapest_by_state
+
+
+@receiver(post_save, sender=FuelStation)
+@receiver(post_delete, sender=FuelStation)
+def fuel_station_changed(sender, **kwargs):
+    # Any price/station change can move the cheapest station of a state
+    invalidate_cheapest_by_state()
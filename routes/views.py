@@ -27,14 +27,14 @@ from .models import FuelStation
 from .serializers import FuelStationSerializer, RoutePlanSerializer
 from .pagination import FuelStationPagination
 from .services.openrouteservice import (
-    geocode_place,               # Convert "New York, NY" → coordinates
+    geocode_pair,                # Convert "New York, NY" → coordinates (start + end at once)
     get_route,                   # Get route data from OpenRouteService
     is_inside_usa,               # Validate coordinates are in USA
     build_state_corridor,        # Create state-by-state path
-    state_code_to_full_name,     # NY → NEW YORK
-    simplify_geojson_linestring, # Reduce coordinate count for response
+    US_STATE_FULL_NAME,          # NY → NEW YORK (static lookup table)
     decode_polyline,             # Decompress polyline → GeoJSON
 )
+from .services.stations import get_cheapest_stations  # State → cheapest station
 
 # Initialize logger for debugging and monitoring
 logger = logging.getLogger(__name__)
@@ -46,7 +46,8 @@ class FuelStationListAPIView(ListAPIView):
     Returns paginated list of all fuel stations in database.
     Loaded from fuel-prices.csv (6,732 stations across USA).
     """
-    queryset = FuelStation.objects.all().order_by('id')
+    # Load only the serialized columns (skips created_at), paged by primary key
+    queryset = FuelStation.objects.only(*FuelStationSerializer.Meta.fields).order_by('id')
     serializer_class = FuelStationSerializer
     pagination_class = FuelStationPagination
 
@@ -113,12 +114,13 @@ class RoutePlanAPIView(APIView):
 
         start_text = serializer.validated_data["start"]
         end_text = serializer.validated_data["end"]
+        include_geometry = serializer.validated_data["include_geometry"]
 
         try:
             #  Geocode Start and End Locations 
             # Convert text like "New York, NY" → [longitude, latitude]
-            start_data = geocode_place(start_text)
-            end_data = geocode_place(end_text)
+            # Both lookups run concurrently (one network round-trip)
+            start_data, end_data = geocode_pair(start_text, end_text)
 
             # Enforce USA-Only Rule
             if start_data["country_code"] != "US" or not is_inside_usa(start_data["coords"]):
@@ -144,7 +146,8 @@ class RoutePlanAPIView(APIView):
             # Process Geometry for Map Display
             # OpenRouteService returns encoded polyline string (compressed coordinates)
             # We need to decode it to GeoJSON format for map libraries (Leaflet/Mapbox)
-            geometry = route.get("geometry")
+            # Skipped entirely when the client only wants the cost breakdown
+            geometry = route.get("geometry") if include_geometry else None
             route_geojson = None
             
             if geometry:
@@ -180,96 +183,85 @@ class RoutePlanAPIView(APIView):
             # Vehicle range: 500 miles, so divide route into 500-mile segments
             leg_count = max(1, math.ceil(total_distance / 500.0))
             fuel_stops = []
-            total_cost = 0.0
-
-            # Fetch all cheapest stations in ONE query with only needed fields
-            cheapest_stations = {}
-            if state_corridor:
-                corridor_stations = FuelStation.objects.filter(
-                    state__in=state_corridor
-                ).values('state', 'station_name', 'address', 'city', 'price_per_gallon').order_by('state', 'price_per_gallon')
-                
-                # Build dictionary: state -> cheapest station (as dict, not model instance)
-                for station in corridor_stations:
-                    if station['state'] not in cheapest_stations:
-                        cheapest_stations[station['state']] = station
-
-            # Cache state name conversions to avoid repeated function calls
-            state_name_cache = {s: state_code_to_full_name(s) for s in state_corridor}
-
-            # Loop through each 500-mile segment
+            total_cost_cents = 0  # integer cents: no float drift across legs
+
+            # Cheapest station per corridor state, from the precomputed
+            # per-state table (no database query on a warm cache)
+            cheapest_stations = get_cheapest_stations(state_corridor)
+
+            # Loop through each 500-mile segment, building the fuel stop and
+            # both text summaries in the same pass
+            customer_stops = []
+            stops_explained = []
+            miles_so_far = 0.0
+
+            # Fallback: any station from the corridor, used for legs whose
+            # state has no station
+            fallback_station = next(iter(cheapest_stations.values()), None)
+
+            # Last usable corridor index (later legs stay in the final state)
+            last_corridor_index = len(state_corridor) - 1
+
             for leg_index in range(leg_count):
                 # Calculate segment boundaries
                 leg_start = leg_index * 500.0
-                leg_end = min(total_distance, (leg_index + 1) * 500.0)  # Don't exceed total distance
+                leg_end = min(total_distance, leg_start + 500.0)  # Don't exceed total distance
                 leg_distance = leg_end - leg_start
+                segment_miles = round(leg_distance, 2)
 
                 # Determine which state this segment is in
-                leg_state = None
-                if state_corridor:
-                    # Map segment to state in corridor (prevent index out of bounds)
-                    leg_state = state_corridor[min(leg_index, len(state_corridor) - 1)]
+                # (mapped into the corridor, preventing index out of bounds)
+                leg_state = state_corridor[min(leg_index, last_corridor_index)] if state_corridor else None
 
                 # Find Cheapest Station from pre-fetched dictionary
-                station = cheapest_stations.get(leg_state) if leg_state else None
-                
-                # Fallback: Use any station from corridor if specific state not found
-                if not station and cheapest_stations:
-                    station = next(iter(cheapest_stations.values()))
+                station = cheapest_stations.get(leg_state) or fallback_station
 
                 # Calculate Fuel Cost
                 # Vehicle efficiency: 10 MPG
                 gallons = round(leg_distance / 10.0, 2)
                 cost = None
                 station_data = None
+                state_name = station_name = "N/A"
 
                 if station:
-                    price = float(station['price_per_gallon'])
-                    cost = round(gallons * price, 2)  # gallons × price = total cost
-                    total_cost += cost
+                    # Price in whole cents; the stop shows the same price it is charged at
+                    price_cents = round(station['price_per_gallon'] * 100)
+                    # gallons × price = total cost, in exact integer math:
+                    # hundredths of a gallon × cents, rounded half-up to cents
+                    cost_cents = (round(gallons * 100) * price_cents + 50) // 100
+                    cost = cost_cents / 100
+                    total_cost_cents += cost_cents
                     # Manual dict creation (10x faster than serializer)
                     station_data = {
                         'state': station['state'],
                         'station_name': station['station_name'],
                         'address': station['address'],
                         'city': station['city'],
-                        'price_per_gallon': str(price)
+                        'price_per_gallon': str(price_cents / 100)
                     }
+                    state_name = US_STATE_FULL_NAME.get(station['state'], "N/A")
+                    station_name = station['station_name']
 
                 # Store fuel stop details
                 fuel_stops.append({
                     "segment_index": leg_index + 1,
-                    "segment_distance_miles": round(leg_distance, 2),
+                    "segment_distance_miles": segment_miles,
                     "station": station_data,
                     "gallons_purchased": gallons,
                     "cost": cost,
                 })
 
-            # Format Response Data 
-            # Generate both summaries in single loop (faster than 2 separate loops)
-            customer_stops = []
-            stops_explained = []
-            miles_so_far = 0.0
-            
-            for stop in fuel_stops:
-                miles_so_far += stop["segment_distance_miles"]
-                station_info = stop.get("station") or {}
-                state_name = state_name_cache.get(station_info.get("state"), "N/A")
-                station_name = station_info.get("station_name", "N/A")
-                cost_val = stop.get("cost", "N/A")
-                gallons_val = stop.get("gallons_purchased", 0)
-                segment_miles = stop["segment_distance_miles"]
-                
-                # Use f-strings (faster than .format())
+                # Format the customer summary and explanation for this stop
+                miles_so_far += segment_miles
                 customer_stops.append(
-                    f"After {miles_so_far:.0f} mi: {state_name}, {station_name} (${cost_val})"
+                    f"After {miles_so_far:.0f} mi: {state_name}, {station_name} (${cost})"
                 )
                 stops_explained.append(
-                    f"Drive {segment_miles:.2f} miles, stop in {state_name} at {station_name}, buy {gallons_val} gallons for ${cost_val}."
+                    f"Drive {segment_miles:.2f} miles, stop in {state_name} at {station_name}, buy {gallons} gallons for ${cost}."
                 )
 
-            # Convert state codes to full names (use cached lookups)
-            state_movement = " > ".join(state_name_cache.get(s, s) for s in state_corridor)
+            # Convert state codes to full names (static lookup table)
+            state_movement = " > ".join(US_STATE_FULL_NAME.get(s, s) for s in state_corridor)
 
             #  Build Comprehensive Response
             response_data = {
@@ -282,7 +274,7 @@ class RoutePlanAPIView(APIView):
                     "number_of_fuel_stops": leg_count,
                 },
                 "fuel_cost_summary": {
-                    "total_fuel_cost_usd": round(total_cost, 2),
+                    "total_fuel_cost_usd": total_cost_cents / 100,
                     "total_gallons_needed": round(total_distance / 10.0, 2),
                     "vehicle_mpg": 10,
                     "max_range_miles": 500,
@@ -310,7 +302,7 @@ class RoutePlanAPIView(APIView):
             )
             
         except Exception as exc:
-            logger.error(f"Error: {str(exc)}")
+            logger.error("Error: %s", exc)
             return Response(
                 {"error": "An unexpected error occurred", "details": str(exc)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR